@@ -10,13 +10,15 @@ class AIClientInterface(ABC):
     """
 
     @abstractmethod
-    def create_completion(self, user_message, is_json=False):
+    def create_completion(self, user_message, is_json=False, use_cache=True):
         """Creates a completion using the AI service.
 
         Args:
             user_message (str): The user's input message or query.
             is_json (bool, optional): Flag indicating if the response should be in JSON format.
                 Defaults to False.
+            use_cache (bool, optional): If False, a previously cached response is not
+                reused, e.g. when retrying after an invalid response. Defaults to True.
 
         Returns:
             str: The AI-generated completion response.
@@ -26,3 +28,38 @@ class AIClientInterface(ABC):
                 by concrete classes.
         """
         pass
+
+    @abstractmethod
+    def create_completions_batch(self, user_messages, is_json=False):
+        """Creates completions for several user messages using the AI service.
+
+        Args:
+            user_messages (list): List of user input messages.
+            is_json (bool, optional): Flag indicating if the responses should be in JSON format.
+                Defaults to False.
+
+        Returns:
+            list: The AI-generated responses, in the same order as user_messages.
+
+        Raises:
+            NotImplementedError: This is an abstract method that must be implemented
+                by concrete classes.
+        """
+        pass
+
+    @abstractmethod
+    def submit_batch(self, prompts):
+        """Submits a batch of prompts for offline processing by the AI service.
+
+        Args:
+            prompts (list): List of (custom_id, user_message, is_json) tuples.
+
+        Returns:
+            dict: The AI-generated responses keyed by custom_id. Prompts that
+                could not be completed are missing from the result.
+
+        Raises:
+            NotImplementedError: This is an abstract method that must be implemented
+                by concrete classes.
+        """
+        pass
@@ -45,7 +45,7 @@ class AnthropicClient(BaseAIClient):
         """
         return Anthropic(api_key=self.api_key)
 
-    def create_completion(self, user_message, is_json=False):
+    def create_completion(self, user_message, is_json=False, use_cache=True):
         """
         Create a completion using the Anthropic API.
 
@@ -53,6 +53,8 @@ class AnthropicClient(BaseAIClient):
             user_message (str): User message.
             is_json (bool, optional): If True, requests response in JSON format.
                 Defaults to False.
+            use_cache (bool, optional): Accepted for interface compatibility;
+                Anthropic responses are not cached.
 
         Returns:
             str: Anthropic API response.
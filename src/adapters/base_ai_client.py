@@ -52,15 +52,53 @@ class BaseAIClient(AIClientInterface):
         pass
 
     @abstractmethod
-    def create_completion(self, user_message, is_json=False):
+    def create_completion(self, user_message, is_json=False, use_cache=True):
         """
         Create a completion using the API.
 
         Args:
             user_message (str): User message.
             is_json (bool, optional): Flag indicating if the response should be in JSON format.
+            use_cache (bool, optional): If False, a cached response is not reused.
 
         Returns:
             str: API response.
         """
         pass
+
+    def create_completions_batch(self, user_messages, is_json=False):
+        """
+        Create completions for several user messages.
+
+        The default implementation calls create_completion once per message.
+        Subclasses may override it to issue the requests concurrently.
+
+        Args:
+            user_messages (list): List of user messages.
+            is_json (bool, optional): Flag indicating if the responses should be in JSON format.
+
+        Returns:
+            list: API responses, in the same order as user_messages.
+        """
+        return [
+            self.create_completion(user_message, is_json)
+            for user_message in user_messages
+        ]
+
+    def submit_batch(self, prompts):
+        """
+        Submit a batch of prompts for offline processing.
+
+        The default implementation completes each prompt with create_completion.
+        Subclasses may override it to use a provider-side batch API.
+
+        Args:
+            prompts (list): List of (custom_id, user_message, is_json) tuples.
+
+        Returns:
+            dict: API responses keyed by custom_id.
+        """
+        return {
+            custom_id: self.create_completion(user_message, is_json)
+            for custom_id, user_message, is_json in prompts
+        }
@@ -1,10 +1,42 @@
 # src/adapters/openai_client.py
-from openai import OpenAI
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import tempfile
+import time
+import httpx
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    DefaultHttpxClient,
+    DefaultAsyncHttpxClient,
+    APIConnectionError,
+    InternalServerError,
+    RateLimitError,
+)
 from src.adapters.base_ai_client import BaseAIClient
+from src.io.completion_cache import CompletionCache
 from src.config.config_loader import ConfigLoader
 from src.config.openai_credentials_manager import OpenAICredentialsManager
 from src.config.credentials_manager_interface import CredentialsManagerInterface
 
+# Models that only support the default temperature (1)
+_TEMPERATURE_RESTRICTED_PATTERNS = ("gpt-5-", "o3-", "o4-")
+
+# Models that don't support the json_object response_format
+_JSON_OBJECT_UNSUPPORTED_PATTERNS = ("gpt-5-nano-",)
+
+# HTTP/2 requires the optional h2 package; fall back to HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool limits shared by the sync and async HTTP clients
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
+# Completions can take minutes, but connecting should not
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
 
 class OpenAIClient(BaseAIClient):
     """
@@ -12,8 +44,16 @@ class OpenAIClient(BaseAIClient):
 
     Implements the BaseAIClient interface to communicate
     with OpenAI services for text generation.
+
+    All instances share one persistent httpx client (HTTP/2 when available),
+    whose connection is opened once at startup, so requests don't pay the
+    TLS handshake.
     """
 
+    # HTTP client shared by all instances
+    _http_client = None
+    _connection_prewarmed = False
+
     def __init__(self, config_loader: ConfigLoader, prompt_key: str):
         """
         Initialize the OpenAI client.
@@ -23,6 +63,17 @@ class OpenAIClient(BaseAIClient):
             prompt_key (str): Key for the prompt to be loaded.
         """
         self.model = config_loader.get_config_value("engine")
+        # Model capabilities don't change, so check them only once
+        self._temperature_restricted = self._is_temperature_restricted_model()
+        self._json_object_supported = self._supports_json_object()
+        # Maximum number of requests in flight in create_completions_batch
+        self.max_concurrency = config_loader.get_config_value(
+            "openai_max_concurrency", 8
+        )
+        # Completions are persisted on disk so re-runs skip identical requests
+        self.cache = CompletionCache(
+            config_loader.get_config_value("openai_cache_file", ".openai_cache.sqlite")
+        )
         super().__init__(config_loader, prompt_key)
 
     def get_credentials_manager(self) -> CredentialsManagerInterface:
@@ -41,9 +92,43 @@ class OpenAIClient(BaseAIClient):
         Returns:
             OpenAI: Initialized OpenAI API client.
         """
-        return OpenAI(api_key=self.api_key)
+        client = OpenAI(api_key=self.api_key, http_client=self._get_http_client())
+        self._prewarm_connection(client)
+        return client
+
+    @classmethod
+    def _get_http_client(cls):
+        """
+        Get the HTTP client shared by all instances, creating it on first use.
+
+        Returns:
+            httpx.Client: Shared HTTP client.
+        """
+        if cls._http_client is None:
+            # The SDK's client keeps its defaults and proxy environment handling
+            cls._http_client = DefaultHttpxClient(
+                http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            )
+        return cls._http_client
+
+    @classmethod
+    def _prewarm_connection(cls, client):
+        """
+        Open the connection to the API with a cheap request, once for the shared
+        HTTP client.
 
-    def create_completion(self, user_message, is_json=False):
+        Args:
+            client (OpenAI): OpenAI API client using the shared HTTP client.
+        """
+        if cls._connection_prewarmed:
+            return
+        cls._connection_prewarmed = True
+        try:
+            client.models.list()
+        except Exception as e:
+            print(f"\n\nError prewarming OpenAI connection: {e}")
+
+    def create_completion(self, user_message, is_json=False, use_cache=True):
         """
         Create a completion using the OpenAI API.
 
@@ -51,42 +136,338 @@ class OpenAIClient(BaseAIClient):
             user_message (str): User message.
             is_json (bool, optional): If True, requests response in JSON format.
                 Defaults to False.
+            use_cache (bool, optional): If False, skips the cached response and
+                overwrites it with the new one. Used when retrying after an
+                invalid response. Defaults to True.
 
         Returns:
             str: OpenAI API response.
         """
-        try:
-            # Build base parameters
-            params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": user_message},
-                ],
-                "max_completion_tokens": 4000,
-            }
-
-            # Some models (like gpt-5-nano) don't support json_object response_format
-            # Check if model supports json_object format before setting it
-            if is_json and self._supports_json_object():
-                params["response_format"] = {"type": "json_object"}
-            elif is_json:
-                # For models that don't support json_object, we'll rely on the prompt
-                # to instruct the model to return JSON (text format)
-                pass
-
-            # Some newer models don't support custom temperature values
-            # Only set temperature if the model is known to support it
-            # Models like gpt-5-mini only support default temperature (1)
-            if not self._is_temperature_restricted_model():
-                params["temperature"] = 0
+        cache_key = self._cache_key(user_message, is_json)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
+        try:
+            params = self._build_params(user_message, is_json)
             completion = self.client.chat.completions.create(**params)
-            return completion.choices[0].message.content
+            content = completion.choices[0].message.content
+            if content:
+                self.cache.set(cache_key, content)
+            return content
         except Exception as e:
             print(f"\n\nError creating OpenAI completion: {e}")
             return ""
 
+    def create_completions_batch(self, user_messages, is_json=False):
+        """
+        Create completions for several user messages concurrently.
+
+        Requests are issued through an AsyncOpenAI client with at most
+        max_concurrency of them in flight; rate limit and server errors are
+        retried with exponential backoff.
+
+        Args:
+            user_messages (list): List of user messages.
+            is_json (bool, optional): If True, requests responses in JSON format.
+                Defaults to False.
+
+        Returns:
+            list: OpenAI API responses, in the same order as user_messages.
+                Failed requests yield an empty string.
+        """
+        if not user_messages:
+            return []
+        return asyncio.run(self._create_completions_async(user_messages, is_json))
+
+    async def _create_completions_async(self, user_messages, is_json):
+        """
+        Run all completions of a batch on a single AsyncOpenAI client.
+
+        The client is created per batch because it is bound to the event loop
+        started by asyncio.run.
+
+        Args:
+            user_messages (list): List of user messages.
+            is_json (bool): If True, requests responses in JSON format.
+
+        Returns:
+            list: OpenAI API responses, in the same order as user_messages.
+        """
+        aclient = AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(
+                http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+            ),
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            return await asyncio.gather(
+                *[
+                    self._create_completion_async(
+                        aclient, semaphore, user_message, is_json
+                    )
+                    for user_message in user_messages
+                ]
+            )
+        finally:
+            await aclient.close()
+
+    async def _create_completion_async(
+        self, aclient, semaphore, user_message, is_json, max_attempts=6
+    ):
+        """
+        Create a single completion, retrying on rate limit and server errors.
+
+        Args:
+            aclient (AsyncOpenAI): Async OpenAI API client.
+            semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+            user_message (str): User message.
+            is_json (bool): If True, requests response in JSON format.
+            max_attempts (int, optional): Maximum number of attempts. Defaults to 6.
+
+        Returns:
+            str: OpenAI API response, or an empty string on failure.
+        """
+        cache_key = self._cache_key(user_message, is_json)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = self._build_params(user_message, is_json)
+        async with semaphore:
+            for attempt in range(max_attempts):
+                try:
+                    completion = await aclient.chat.completions.create(**params)
+                    content = completion.choices[0].message.content
+                    if content:
+                        self.cache.set(cache_key, content)
+                    return content
+                except (
+                    RateLimitError,
+                    InternalServerError,
+                    APIConnectionError,
+                ) as e:
+                    if attempt == max_attempts - 1:
+                        print(f"\n\nError creating OpenAI completion: {e}")
+                        return ""
+                    await asyncio.sleep(2**attempt + random.random())
+                except Exception as e:
+                    print(f"\n\nError creating OpenAI completion: {e}")
+                    return ""
+
+    def submit_batch(self, prompts, poll_interval=10, max_poll_interval=300):
+        """
+        Complete prompts through the OpenAI Batch API.
+
+        The prompts are written to a JSONL file, uploaded and processed as a
+        batch job with a 24h completion window, which is cheaper and has higher
+        rate limits than regular requests. This call blocks until the job ends.
+
+        Args:
+            prompts (list): List of (custom_id, user_message, is_json) tuples.
+            poll_interval (int, optional): Initial delay in seconds between status
+                checks. Doubles after every check. Defaults to 10.
+            max_poll_interval (int, optional): Maximum delay in seconds between
+                status checks. Defaults to 300.
+
+        Returns:
+            dict: OpenAI API responses keyed by custom_id. Prompts that failed
+                are missing from the result.
+        """
+        # Only submit the prompts that are not cached yet
+        results = {}
+        cache_keys = {}
+        pending_prompts = []
+        for custom_id, user_message, is_json in prompts:
+            cache_key = self._cache_key(user_message, is_json)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                results[str(custom_id)] = cached
+            else:
+                cache_keys[str(custom_id)] = cache_key
+                pending_prompts.append((custom_id, user_message, is_json))
+
+        if pending_prompts:
+            batch_results = self._run_batch(
+                pending_prompts, poll_interval, max_poll_interval
+            )
+            for custom_id, content in batch_results.items():
+                if content and custom_id in cache_keys:
+                    self.cache.set(cache_keys[custom_id], content)
+            results.update(batch_results)
+
+        return results
+
+    def _run_batch(self, prompts, poll_interval, max_poll_interval):
+        """
+        Create a batch job for the prompts and wait for its results.
+
+        Args:
+            prompts (list): List of (custom_id, user_message, is_json) tuples.
+            poll_interval (int): Initial delay in seconds between status checks.
+            max_poll_interval (int): Maximum delay in seconds between status checks.
+
+        Returns:
+            dict: OpenAI API responses keyed by custom_id.
+        """
+        try:
+            input_file_id = self._upload_batch_file(prompts)
+            batch = self.client.batches.create(
+                input_file_id=input_file_id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            print(f"OpenAI batch {batch.id} created with {len(prompts)} request(s)")
+
+            # Poll with exponential backoff until the batch reaches a final state
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, max_poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+                print(f"OpenAI batch {batch.id} status: {batch.status}")
+
+            if batch.status != "completed":
+                print(f"\n\nOpenAI batch {batch.id} ended with status {batch.status}")
+
+            # Expired batches may still have partial results
+            if not batch.output_file_id:
+                return {}
+            output = self.client.files.content(batch.output_file_id)
+            return self._parse_batch_output(output.text)
+        except Exception as e:
+            print(f"\n\nError processing OpenAI batch: {e}")
+            return {}
+
+    def _upload_batch_file(self, prompts):
+        """
+        Write the batch requests to a JSONL file and upload it.
+
+        Args:
+            prompts (list): List of (custom_id, user_message, is_json) tuples.
+
+        Returns:
+            str: ID of the uploaded file.
+        """
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for custom_id, user_message, is_json in prompts:
+                    request = {
+                        "custom_id": str(custom_id),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._build_params(user_message, is_json),
+                    }
+                    f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+            with open(path, "rb") as f:
+                uploaded = self.client.files.create(file=f, purpose="batch")
+            return uploaded.id
+        finally:
+            os.remove(path)
+
+    def _parse_batch_output(self, output_text):
+        """
+        Parse the JSONL output file of a batch job.
+
+        Args:
+            output_text (str): Content of the batch output file.
+
+        Returns:
+            dict: Response content keyed by custom_id, for successful requests.
+        """
+        results = {}
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+
+            # A malformed line only loses its own request, not the whole batch
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"\n\nError decoding OpenAI batch output line: {e}")
+                continue
+
+            response = item.get("response") or {}
+            if item.get("error") or response.get("status_code") != 200:
+                print(
+                    f"\n\nError in OpenAI batch request {item.get('custom_id')}: "
+                    f"{item.get('error') or response.get('body')}"
+                )
+                continue
+
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[item["custom_id"]] = content
+            except (KeyError, IndexError, TypeError) as e:
+                print(
+                    f"\n\nError reading OpenAI batch request "
+                    f"{item.get('custom_id')}: {e!r}"
+                )
+        return results
+
+    def clear_cache(self):
+        """
+        Remove all cached completions, forcing fresh API requests.
+        """
+        self.cache.clear()
+
+    def _cache_key(self, user_message, is_json):
+        """
+        Build the cache key of a completion request.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool): If True, the response is requested in JSON format.
+
+        Returns:
+            str: Cache key.
+        """
+        return CompletionCache.make_key(
+            self.model, self.system_message, user_message, is_json
+        )
+
+    def _build_params(self, user_message, is_json):
+        """
+        Build the chat completion request parameters.
+
+        Args:
+            user_message (str): User message.
+            is_json (bool): If True, requests response in JSON format.
+
+        Returns:
+            dict: Parameters for chat.completions.create.
+        """
+        # Build base parameters
+        params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.system_message},
+                {"role": "user", "content": user_message},
+            ],
+            "max_completion_tokens": 4000,
+        }
+
+        # Some models (like gpt-5-nano) don't support json_object response_format
+        # Check if model supports json_object format before setting it
+        if is_json and self._json_object_supported:
+            params["response_format"] = {"type": "json_object"}
+        elif is_json:
+            # For models that don't support json_object, we'll rely on the prompt
+            # to instruct the model to return JSON (text format)
+            pass
+
+        # Some newer models don't support custom temperature values
+        # Only set temperature if the model is known to support it
+        # Models like gpt-5-mini only support default temperature (1)
+        if not self._temperature_restricted:
+            params["temperature"] = 0
+
+        return params
+
     def _is_temperature_restricted_model(self):
         """
         Check if the model only supports default temperature value.
@@ -97,12 +478,9 @@ class OpenAIClient(BaseAIClient):
         Returns:
             bool: True if the model only supports default temperature.
         """
-        restricted_patterns = [
-            "gpt-5-",
-            "o3-",
-            "o4-",
-        ]
-        return any(pattern in self.model for pattern in restricted_patterns)
+        return any(
+            pattern in self.model for pattern in _TEMPERATURE_RESTRICTED_PATTERNS
+        )
 
     def _supports_json_object(self):
         """
@@ -114,13 +492,8 @@ class OpenAIClient(BaseAIClient):
         Returns:
             bool: True if the model supports json_object format.
         """
-        # Models that don't support json_object format
-        unsupported_patterns = [
-            "gpt-5-nano-",
-        ]
-
         # If model matches unsupported patterns, return False
-        if any(pattern in self.model for pattern in unsupported_patterns):
+        if any(pattern in self.model for pattern in _JSON_OBJECT_UNSUPPORTED_PATTERNS):
             return False
 
         # Default to supporting json_object for other models
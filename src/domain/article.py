@@ -9,8 +9,30 @@ class Article(BaseModel):
 
     This class encapsulates all data related to an article, including
     its identification, content, authors, and references.
+
+    The known fields are stored in __slots__ for faster attribute access and
+    smaller instances; additional attributes passed as keyword arguments are
+    kept in the instance __dict__.
     """
 
+    __slots__ = (
+        "id_jems",
+        "title_orig",
+        "title_en",
+        "abstract_orig",
+        "abstract_en",
+        "keywords_orig",
+        "keywords_en",
+        "language",
+        "section_abbrev",
+        "first_page",
+        "pages",
+        "doi",
+        "num_pages",
+        "authors",
+        "references",
+    )
+
     # Define the mapping from dictionary keys to object attributes
     field_mapping = {
         "id_jems": "id_jems",
@@ -144,13 +166,30 @@ class Article(BaseModel):
         Returns:
             Dict: Dictionary representation of the article
         """
-        # Get the base dictionary from the parent class method
-        result = super().to_dict()
+        result = {
+            "id_jems": self.id_jems,
+            "titleOrig": self.title_orig,
+            "titleEn": self.title_en,
+            "abstractOrig": self.abstract_orig,
+            "abstractEn": self.abstract_en,
+            "keywordsOrig": self.keywords_orig,
+            "keywordsEn": self.keywords_en,
+            "language": self.language,
+            "sectionAbbrev": self.section_abbrev,
+            "firstPage": self.first_page,
+            "pages": self.pages,
+            "doi": self.doi,
+            "numPages": self.num_pages,
+            "authors": [author.to_dict() for author in self.authors],
+            "references": [reference.to_dict() for reference in self.references],
+        }
+
+        # Add the additional attributes
+        for attr, value in self.__dict__.items():
+            if not attr.startswith("_"):  # Skip internal attributes
+                result[attr] = value
 
-        # Add the related objects
         result["idJEMS"] = self.id_jems  # For backward compatibility
-        result["authors"] = [author.to_dict() for author in self.authors]
-        result["references"] = [reference.to_dict() for reference in self.references]
 
         return result
 
@@ -0,0 +1,81 @@
+# src/io/completion_cache.py
+import hashlib
+import sqlite3
+import threading
+
+
+class CompletionCache:
+    """
+    Disk-backed cache of AI completions stored in a SQLite database.
+
+    Completions are keyed by a hash of everything that determines the response
+    (model, system message, user message and response format), so re-running a
+    migration does not repeat identical API calls.
+    """
+
+    def __init__(self, path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS completions "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Build a cache key from the parts that determine a completion.
+
+        Args:
+            *parts: Values identifying the request.
+
+        Returns:
+            str: Hexadecimal hash of the parts.
+        """
+        data = "|".join(str(part) for part in parts).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Get a cached completion.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            str: Cached completion, or None if the key is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, content):
+        """
+        Store a completion in the cache.
+
+        Args:
+            key (str): Cache key.
+            content (str): Completion to store.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO completions (key, content) VALUES (?, ?)",
+                (key, content),
+            )
+
+    def clear(self):
+        """
+        Remove all cached completions.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM completions")
@@ -1,7 +1,7 @@
 # src/logging/json_logger.py
-import json
 import os
 import datetime
+import orjson
 from src.config.config_loader import ConfigLoader
 
 
@@ -10,9 +10,12 @@ class JsonLogger:
     Utility class for logging in JSON format.
 
     Facilitates registering data structures in JSON files
-    with timestamp and directory support.
+    with timestamp and directory support. Serialization uses orjson.
     """
 
+    # Options used for every dump: 2-space indentation and support for non-str keys
+    _dump_options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
     # Class-level configuration
     _config_loader = None
     _base_dir = None
@@ -95,8 +98,37 @@ class JsonLogger:
             }
 
         # Save data in JSON format
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data_to_save, option=cls._dump_options))
+
+        return file_path
+
+    @classmethod
+    def stream_json(cls, file_name, items, directory=None):
+        """
+        Saves the items of an iterable as a JSON list, writing one item at a time.
+
+        Unlike print_json, the items don't need to be materialized in a list first,
+        so a generator can be passed to keep memory usage low.
+
+        Args:
+            file_name (str): File name (without extension).
+            items (iterable): Items to be saved as elements of a JSON list.
+            directory (str, optional): Directory to save the file. If None, uses the default directory.
+
+        Returns:
+            str: Complete path of the saved file.
+        """
+        # Prepare file path
+        file_path = cls._prepare_path(file_name, directory)
+
+        # Save items in JSON format, separated by commas
+        with open(file_path, "wb") as f:
+            f.write(b"[")
+            for index, item in enumerate(items):
+                f.write(b",\n" if index else b"\n")
+                f.write(orjson.dumps(item, option=cls._dump_options))
+            f.write(b"\n]")
 
         return file_path
 
@@ -116,7 +148,7 @@ class JsonLogger:
         file_path = cls._prepare_path(file_name, directory)
 
         # Read data from JSON file
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
 
         return data
@@ -191,19 +191,25 @@ class ArticleExtractor:
         return self.extract_info_with_ai(self.references_ai_client, last_pages)
 
     def do_field_completion_of_missing_values_in_dic(
-        self, articles_list: List[Article]
+        self, articles_list: List[Article], use_batch_api: bool = False
     ) -> List[Article]:
         """Completes missing fields in article metadata.
 
         Args:
             articles_list (list): List of Article objects with metadata.
+            use_batch_api (bool, optional): If True, submits the prompts as an
+                offline batch job instead of regular requests. Defaults to False.
 
         Returns:
             list: Updated list of Article objects with completed fields.
         """
-        updated_articles = []
+        updated_articles = list(articles_list)
 
-        for article in articles_list:
+        # Collect the prompts of all articles that need completion, so they can
+        # be sent to the AI client in a single batch
+        pending_indexes = []
+        instructions = []
+        for index, article in enumerate(articles_list):
             # Convert to dictionary for AI compatibility
             article_dict = article.to_dict()
 
@@ -224,21 +230,59 @@ class ArticleExtractor:
                 clean_dict.pop("firstPages", None)
                 clean_dict.pop("lastPages", None)
 
-                new_dict = self.extract_info_with_ai(
-                    self.field_completion_ai_client, json.dumps(clean_dict)
-                )
+                pending_indexes.append(index)
+                instructions.append(json.dumps(clean_dict))
 
-                if new_dict and isinstance(new_dict, dict):
-                    # Convert the updated dictionary back to an Article object
-                    updated_article = Article.from_dict(new_dict)
-                    updated_articles.append(updated_article)
-                else:
-                    updated_articles.append(article)
-            else:
-                updated_articles.append(article)
+        if use_batch_api:
+            results = self.field_completion_ai_client.submit_batch(
+                [
+                    (str(index), instruction, True)
+                    for index, instruction in zip(pending_indexes, instructions)
+                ]
+            )
+            responses = [results.get(str(index), "") for index in pending_indexes]
+        else:
+            responses = self.field_completion_ai_client.create_completions_batch(
+                instructions, True
+            )
+
+        # Splice the completed articles back into their original positions
+        for index, instruction, json_info in zip(
+            pending_indexes, instructions, responses
+        ):
+            new_dict = self.parse_batch_response(
+                self.field_completion_ai_client, instruction, json_info
+            )
+
+            if new_dict and isinstance(new_dict, dict):
+                # Convert the updated dictionary back to an Article object
+                updated_articles[index] = Article.from_dict(new_dict)
 
         return updated_articles
 
+    def parse_batch_response(
+        self, ai_client: AIClientInterface, instruction: str, json_info: str
+    ) -> Dict:
+        """Parses a response obtained from a batch of completions.
+
+        If the response cannot be parsed, the instruction is retried
+        individually through extract_info_with_ai.
+
+        Args:
+            ai_client (AIClientInterface): AI client that produced the response.
+            instruction (str): Instruction sent to the AI.
+            json_info (str): AI response that should contain JSON.
+
+        Returns:
+            dict: Dictionary with extracted information.
+        """
+        try:
+            return self.parse_ai_response(json_info)
+        except (ValueError, json.JSONDecodeError) as e:
+            print(f"\n\n\n**** Error decoding JSON: {e} ***")
+            # The batch request counts as the first attempt
+            return self.extract_info_with_ai(ai_client, instruction, 1)
+
     def has_empty_fields(self, dictionary: Dict) -> bool:
         """Checks if the dictionary has empty fields.
 
@@ -271,7 +315,10 @@ class ArticleExtractor:
         Returns:
             dict: Dictionary with extracted information.
         """
-        json_info = ai_client.create_completion(instruction, True)
+        # Retries must not get the same invalid response back from the cache
+        json_info = ai_client.create_completion(
+            instruction, True, use_cache=recursion_count == 0
+        )
 
         try:
             return self.parse_ai_response(json_info)
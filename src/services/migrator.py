@@ -7,8 +7,50 @@ from src.services.article_extractor import ArticleExtractor
 from src.io.csv_writer import CsvWriter
 from src.logging.json_logger import JsonLogger
 from src.domain.article import Article
+from collections import Counter, defaultdict
+import functools
 import os
+import queue
 import re
+import threading
+
+# Matches http(s)://doi.org/ and http(s)://dx.doi.org/ URL prefixes
+_DOI_URL_RE = re.compile(r"^https?://(?:dx\.)?doi\.org/")
+
+# Matches the prefix of a DOI in the format 10.xxxx/prefix.year.suffix
+_DOI_PREFIX_RE = re.compile(r"^(10\.\d+/[^/]+\.\d+)\.")
+
+# Article fields kept from the website data when merging with PDF data
+_WEBSITE_PRESERVED_ATTRS = frozenset(
+    {"id_jems", "section_abbrev", "first_page", "num_pages", "doi"}
+)
+
+# Article fields copied from the PDF data when merging with website data
+_PDF_MERGED_ATTRS = tuple(
+    attr for attr in Article.__slots__ if attr not in _WEBSITE_PRESERVED_ATTRS
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _update_pages(first_page, num_pages):
+    """
+    Builds the pages field from the first page and number of pages.
+
+    Args:
+        first_page (str): First page number as a string.
+        num_pages (int): Number of pages.
+
+    Returns:
+        str: Page range, or first_page unchanged if it is not a number.
+    """
+    if not first_page or not first_page.isdigit():
+        return first_page
+
+    first_page_int = int(first_page)
+    num_pages = int(num_pages)
+    if num_pages == 1:
+        return str(first_page_int)
+    return f"{first_page_int}-{first_page_int + num_pages - 1}"
 
 
 class Migrator:
@@ -36,6 +78,14 @@ class Migrator:
         # doi_prefix is now optional - will be inferred from extracted DOIs if not provided
         self.doi_prefix = config_loader.get_config_value("doi_prefix", None)
         self.inferred_doi_prefix = None  # Will be set after extracting DOIs
+        self._update_clean_doi_prefix()
+        # Number of PDFs downloaded concurrently
+        self.download_workers = config_loader.get_config_value("download_workers", 32)
+        # Field completion goes through the offline batch API for large years
+        self.use_batch_api = config_loader.get_config_value("use_batch_api", False)
+        self.batch_api_min_articles = config_loader.get_config_value(
+            "batch_api_min_articles", 50
+        )
 
         # Generate directories based on year
         self.pdf_save_dir = os.path.join(self.output_dir, f"{self.year}", "pdfs")
@@ -45,7 +95,9 @@ class Migrator:
         os.makedirs(self.pdf_save_dir, exist_ok=True)
         os.makedirs(self.csv_save_dir, exist_ok=True)
 
-        self.downloader = PDFDownloader(self.site_url, self.pdf_save_dir)
+        self.downloader = PDFDownloader(
+            self.site_url, self.pdf_save_dir, self.download_workers
+        )
         self.processor = PDFProcessor(self.pdf_save_dir)
         self.parser = OJSHTMLParser(self.site_url)
         self.extractor = article_extractor
@@ -61,11 +113,12 @@ class Migrator:
         Returns:
             list: List of Article objects containing article metadata.
         """
-        # 1) Download all PDFs from the specified website to a directory
-        self.downloader.donwload_pdf_files_from_url(num_files)
+        # 1) Download all PDFs from the specified website to a directory,
+        # extracting the text of each PDF as soon as it is on disk
+        all_files_data = self.download_and_process_pdfs(num_files, num_pages)
 
         # 2) Extract article information from the downloaded PDFs
-        articles_list = self.extract_metadata(num_files, num_pages)
+        articles_list = self.extract_metadata(num_files, num_pages, all_files_data)
 
         # 3) Complete missing fields in the articles by calling the AI API
         self.complete_missing_fields(articles_list)
@@ -73,21 +126,63 @@ class Migrator:
         # 4) Return the processed metadata
         return articles_list
 
-    def extract_metadata(self, num_files=-1, num_pages=11):
+    def download_and_process_pdfs(self, num_files=-1, num_pages=11):
+        """
+        Downloads the PDFs and extracts their text in a producer-consumer pipeline.
+
+        A downloader thread puts each PDF on a bounded queue as soon as it is on
+        disk, while the processor parses the queued files on its process pool, so
+        network I/O and text extraction overlap.
+
+        Args:
+            num_files (int, optional): Number of PDF files to download. Default is -1, which downloads all files.
+            num_pages (int, optional): Number of pages to process from each PDF. Default is 11.
+
+        Returns:
+            list: List of dictionaries with the text extracted from each PDF.
+        """
+        file_queue = queue.Queue(maxsize=64)
+        download_errors = []
+
+        def download():
+            try:
+                self.downloader.donwload_pdf_files_from_url(num_files, file_queue.put)
+            except Exception as e:
+                download_errors.append(e)
+            finally:
+                # Signal the end of the downloads
+                file_queue.put(None)
+
+        downloader_thread = threading.Thread(target=download, daemon=True)
+        downloader_thread.start()
+        all_files_data = self.processor.process_pdfs_from_queue(
+            file_queue, save_files=False, number_of_pages_to_process=num_pages
+        )
+        downloader_thread.join()
+
+        if download_errors:
+            raise download_errors[0]
+
+        return all_files_data
+
+    def extract_metadata(self, num_files=-1, num_pages=11, all_files_data=None):
         """
         Extracts metadata from the PDFs and website.
 
         Args:
             num_files (int, optional): Number of PDF files to process. Default is -1, which processes all files.
             num_pages (int, optional): Number of pages to process from each PDF. Default is 11.
+            all_files_data (list, optional): Text already extracted from the PDFs. Default is None,
+                which processes all PDFs in the directory.
 
         Returns:
             list: List of Article objects containing article metadata.
         """
         # 1) Process all PDFs in the directory, extracting the text
-        all_files_data = self.processor.process_all_pdfs(
-            save_files=False, number_of_pages_to_process=num_pages
-        )
+        if all_files_data is None:
+            all_files_data = self.processor.process_all_pdfs(
+                save_files=False, number_of_pages_to_process=num_pages
+            )
 
         # 2) Extract article information from the website into a list of dictionaries
         website_articles_data_list = self.parser.extract_articles_info_from_the_website(
@@ -109,9 +204,9 @@ class Migrator:
         )
 
         # 5) Log article metadata before field completion (convert to dict for logging)
-        articles_dict_list = [article.to_dict() for article in articles_list]
-        JsonLogger.print_json(
-            "articles_metadata_antes_do_field_completion", articles_dict_list
+        JsonLogger.stream_json(
+            "articles_metadata_antes_do_field_completion",
+            (article.to_dict() for article in articles_list),
         )
 
         # 6) Write article information to CSV files
@@ -147,14 +242,17 @@ class Migrator:
             ]
 
         # Complete missing fields in articles using AI
+        use_batch_api = (
+            self.use_batch_api and len(articles_list) >= self.batch_api_min_articles
+        )
         updated_articles = self.extractor.do_field_completion_of_missing_values_in_dic(
-            articles_list
+            articles_list, use_batch_api
         )
 
         # Log article metadata after field completion (convert to dict for logging)
-        updated_articles_dict = [article.to_dict() for article in updated_articles]
-        JsonLogger.print_json(
-            "articles_metadata_apos_do_field_completion", updated_articles_dict
+        JsonLogger.stream_json(
+            "articles_metadata_apos_do_field_completion",
+            (article.to_dict() for article in updated_articles),
         )
 
         # Write article information to CSV files
@@ -182,22 +280,53 @@ class Migrator:
         # Convert pdf_articles_list to a dictionary for O(1) access by key
         pdf_articles_dict = {article.id_jems: article for article in pdf_articles_list}
 
+        get_pdf_article = pdf_articles_dict.get
+        normalize_doi = self._normalize_doi
+
         # New list for merged articles
         merged_articles_list = []
 
-        # First pass: collect all extracted DOIs to infer prefix if needed
+        # DOIs extracted from the website and PDFs, used to infer the prefix
         extracted_dois = []
+
+        # Process each item in website_articles_data_list
         for website_article in website_articles_data_list:
             # Check if DOI was extracted from website
-            if "doi" in website_article and website_article["doi"]:
-                extracted_dois.append(website_article["doi"])
+            website_doi = website_article.get("doi")
+            if website_doi:
+                extracted_dois.append(website_doi)
+
+            # Website entries without a matching PDF are skipped
+            pdf_article = get_pdf_article(website_article["idJEMS"])
+            if pdf_article is None:
+                continue
 
             # Check if DOI was extracted from PDF
-            idJEMS = website_article["idJEMS"]
-            if idJEMS in pdf_articles_dict:
-                pdf_article = pdf_articles_dict[idJEMS]
-                if hasattr(pdf_article, "doi") and pdf_article.doi:
-                    extracted_dois.append(pdf_article.doi)
+            if pdf_article.doi:
+                extracted_dois.append(pdf_article.doi)
+
+            # Create a base Article from the website data
+            merged_article = Article.from_dict(website_article)
+
+            # Update with PDF article data, skipping the fields we want to
+            # keep from website data (including its DOI)
+            for attr in _PDF_MERGED_ATTRS:
+                setattr(merged_article, attr, getattr(pdf_article, attr))
+
+            # Additional attributes extracted from the PDF (e.g. firstPages)
+            for attr, value in pdf_article.__dict__.items():
+                setattr(merged_article, attr, value)
+
+            # Normalize website DOI if it was extracted
+            if website_doi:
+                merged_article.doi = normalize_doi(website_doi)
+
+            # Update pages field
+            merged_article.pages = self.update_pages(
+                website_article["firstPage"], pdf_article.num_pages
+            )
+
+            merged_articles_list.append(merged_article)
 
         # Infer DOI prefix from extracted DOIs if not provided in config
         if not self.doi_prefix and extracted_dois:
@@ -206,48 +335,12 @@ class Migrator:
                 print(
                     f"Prefixo DOI inferido automaticamente: {self.inferred_doi_prefix}"
                 )
+            self._update_clean_doi_prefix()
 
-        # Process each item in website_articles_data_list
-        for website_article in website_articles_data_list:
-            idJEMS = website_article["idJEMS"]
-            if idJEMS in pdf_articles_dict:
-                pdf_article = pdf_articles_dict[idJEMS]
-
-                # Create a base Article from the website data
-                merged_article = Article.from_dict(website_article)
-
-                # Update with PDF article data, but preserve DOI from website if it exists
-                website_doi = (
-                    merged_article.doi if hasattr(merged_article, "doi") else None
-                )
-
-                for attr, value in pdf_article.__dict__.items():
-                    # Skip certain fields we want to keep from website data
-                    if attr not in [
-                        "id_jems",
-                        "section_abbrev",
-                        "first_page",
-                        "num_pages",
-                        "doi",  # Preserve DOI from website if available
-                    ]:
-                        # Normalize DOI if it comes from PDF
-                        if attr == "doi" and value:
-                            value = self._normalize_doi(value)
-                        setattr(merged_article, attr, value)
-
-                # Restore website DOI if it was extracted (normalize it)
-                if website_doi:
-                    merged_article.doi = self._normalize_doi(website_doi)
-
-                # Update pages field
-                merged_article.pages = self.update_pages(
-                    website_article["firstPage"], pdf_article.num_pages
-                )
-
-                # Correct/generate DOI only if not already extracted
-                self.correct_doi(merged_article)
-
-                merged_articles_list.append(merged_article)
+        # Correct/generate DOI only if not already extracted. This needs the
+        # inferred prefix, so it runs once all DOIs have been collected
+        for merged_article in merged_articles_list:
+            self.correct_doi(merged_article)
 
         return merged_articles_list
 
@@ -262,15 +355,7 @@ class Migrator:
         Returns:
             str: Updated pages field.
         """
-        if first_page and first_page.isdigit():
-            first_page_int = int(first_page)
-            if num_pages == 1:
-                return str(first_page_int)
-            else:
-                last_page = first_page_int + int(num_pages) - 1
-                return f"{first_page_int}-{last_page}"
-        else:
-            return first_page
+        return _update_pages(first_page, num_pages)
 
     def _normalize_doi(self, doi):
         """
@@ -285,8 +370,12 @@ class Migrator:
         if not doi:
             return ""
 
-        # Remove http://, https://, dx.doi.org/, doi.org/ prefixes
-        normalized = re.sub(r"^https?://(dx\.)?doi\.org/", "", doi.strip())
+        normalized = doi.strip()
+
+        # Remove http://, https://, dx.doi.org/, doi.org/ prefixes. Most DOIs are
+        # already bare identifiers, so only run the regex on URLs
+        if normalized.startswith(("http://", "https://")):
+            normalized = _DOI_URL_RE.sub("", normalized)
         return normalized
 
     def _infer_doi_prefix(self, dois):
@@ -302,40 +391,28 @@ class Migrator:
         if not dois:
             return None
 
-        # Normalize DOIs - remove https://doi.org/ prefix if present
-        normalized_dois = []
-        for doi in dois:
-            if not doi:
-                continue
-            # Remove http/https and doi.org prefixes
-            normalized = self._normalize_doi(doi)
-            if normalized:
-                normalized_dois.append(normalized)
-
-        if not normalized_dois:
-            return None
-
-        # Find common prefix pattern
-        # DOI format is typically: 10.xxxx/prefix.year.suffix
-        # We want to extract: 10.xxxx/prefix.year.
-        prefix_patterns = []
-        for doi in normalized_dois:
-            # Match pattern: 10.xxxx/prefix.year.xxxxx
-            match = re.match(r"^(10\.\d+/[^/]+\.\d+)\.", doi)
-            if match:
-                prefix_patterns.append(match.group(1) + ".")
-
-        if not prefix_patterns:
+        normalize_doi = self._normalize_doi
+
+        def prefix_patterns():
+            # DOI format is typically: 10.xxxx/prefix.year.suffix
+            # We want to extract: 10.xxxx/prefix.year.
+            for doi in dois:
+                if not doi:
+                    continue
+                # Remove http/https and doi.org prefixes
+                normalized = normalize_doi(doi)
+                match = _DOI_PREFIX_RE.match(normalized) if normalized else None
+                if match:
+                    yield match.group(1) + "."
+
+        # Count prefixes in a single pass, without intermediate lists
+        prefix_counts = Counter(prefix_patterns())
+        if not prefix_counts:
             return None
 
-        # Find the most common prefix pattern
-        from collections import Counter
-
-        prefix_counts = Counter(prefix_patterns)
-        most_common = prefix_counts.most_common(1)[0][0]
-
-        # Return normalized prefix (without URL) - just the identifier pattern
-        return most_common
+        # Return the most common normalized prefix (without URL) - just the
+        # identifier pattern
+        return prefix_counts.most_common(1)[0][0]
 
     def correct_doi(self, article):
         """
@@ -352,25 +429,24 @@ class Migrator:
             return
 
         # Only generate DOI if we have prefix and first_page
-        doi_prefix = self.doi_prefix or self.inferred_doi_prefix
-
-        if not doi_prefix:
+        if not self._clean_doi_prefix:
             print(
                 "Aviso: Não foi possível gerar DOI - prefixo não disponível e não foi possível inferir."
             )
             return
 
-        if hasattr(article, "first_page") and article.first_page:
-            # Normalize prefix (remove URL if present)
-            clean_prefix = self._normalize_doi(doi_prefix)
-            if not clean_prefix:
-                # If prefix was in URL format, try to extract from it
-                clean_prefix = re.sub(r"^https?://(dx\.)?doi\.org/", "", doi_prefix)
-            clean_prefix = clean_prefix.rstrip("/")
-
+        if article.first_page:
             # Generate DOI in normalized format (identifier only, no URL)
-            generated_doi = f"{clean_prefix}{self.year}.{article.first_page}"
-            article.doi = generated_doi
+            article.doi = f"{self._clean_doi_prefix}{self.year}.{article.first_page}"
+
+    def _update_clean_doi_prefix(self):
+        """
+        Normalizes the configured or inferred DOI prefix once, so correct_doi
+        can reuse it for every article.
+        """
+        doi_prefix = self.doi_prefix or self.inferred_doi_prefix
+        # Normalize prefix (remove URL if present)
+        self._clean_doi_prefix = self._normalize_doi(doi_prefix).rstrip("/")
 
     def write_csv_by_workshop(self, articles_list, antes=True):
         """
@@ -381,18 +457,12 @@ class Migrator:
             antes (bool): If True, adds 'antes_' prefix to filenames.
         """
         # Group articles by section
-        workshops = {}
+        workshops = defaultdict(list)
         for article in articles_list:
-            section = (
-                article.section_abbrev
-                if hasattr(article, "section_abbrev")
-                else article.to_dict().get("sectionAbbrev", "UNKNOWN")
+            workshops[getattr(article, "section_abbrev", None) or "UNKNOWN"].append(
+                article
             )
 
-            if section not in workshops:
-                workshops[section] = []
-            workshops[section].append(article)
-
         # Create CSV files for each workshop
         for workshop_name, workshop_articles in workshops.items():
             if not workshop_articles:
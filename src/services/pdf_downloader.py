@@ -1,30 +1,82 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import os
+import shutil
+import tempfile
 
 
 class PDFDownloader:
     """
     A class for downloading and saving PDF files from a given base URL.
 
+    Downloads run concurrently on a thread pool sharing a single connection-pooled
+    requests.Session, so TCP handshakes and server latency overlap across files.
+
     Args:
         base_url (str): The base URL from which to retrieve the PDF files.
         save_directory (str): The directory where the downloaded PDF files will be saved.
+        max_workers (int, optional): Number of concurrent downloads. Default is 32.
 
     Methods:
+        download_file_to(url, filepath): Streams a file from the given URL to disk.
         download_and_save_pdf(url): Downloads and saves a PDF file from the given URL.
         get_pdf_urls(): Retrieves the URLs of all the PDF files from the base URL.
         donwload_pdf_files_from_url(num_urls_to_process): Downloads and saves all the PDF files from the base URL.
 
     """
 
-    def __init__(self, base_url, save_directory):
+    def __init__(self, base_url, save_directory, max_workers=32):
         self.base_url = base_url
         self.save_directory = save_directory
+        self.max_workers = max_workers
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """
+        Creates a requests.Session with keep-alive connection pooling and retries.
+
+        Returns:
+            requests.Session: Session shared by all downloads of this instance.
+
+        """
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_filepath(self, url):
+        """
+        Builds the local filepath where the PDF file from the given URL is saved.
+
+        Args:
+            url (str): The URL of the PDF file.
+
+        Returns:
+            str: The local filepath of the PDF file.
+
+        """
+        filename = url.split("/")[-1]
+        if not filename.endswith(".pdf"):
+            filename += ".pdf"
+        return os.path.join(self.save_directory, filename)
 
     def download_file(self, url):
         """
-        Downloads a file from the given URL.
+        Downloads a file from the given URL into memory.
+        Meant for small files such as HTML pages; use download_file_to for PDFs.
 
         Args:
             url (str): The URL of the file to download.
@@ -33,40 +85,71 @@ class PDFDownloader:
             bytes: The content of the downloaded file.
 
         """
-        response = requests.get(url)
+        response = self.session.get(url, timeout=(5, 30))
         response.raise_for_status()
         return response.content
 
-    def download_and_save_pdf(self, url):
+    def download_file_to(self, url, filepath):
+        """
+        Downloads a file from the given URL, streaming it straight to disk.
+
+        The file is written to a temporary file in the same directory and moved
+        into place when complete, so an interrupted download never leaves a
+        partial file behind.
+
+        Args:
+            url (str): The URL of the file to download.
+            filepath (str): The path where the file will be saved.
+
+        Returns:
+            str: The path of the saved file.
+
+        """
+        with self.session.get(url, stream=True, timeout=(5, 60)) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding while copying
+            response.raw.decode_content = True
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(filepath) or ".", suffix=".part"
+            )
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    shutil.copyfileobj(response.raw, file, length=1 << 16)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        return filepath
+
+    def download_and_save_pdf(self, url, existing_filenames=None):
         """
         Downloads and saves a PDF file from the given URL.
         If the file already exists, skips the download.
 
         Args:
             url (str): The URL of the PDF file to download.
+            existing_filenames (set, optional): Names of the files already in the save
+                directory. If given, it is used instead of checking the disk, and the
+                save directory is assumed to exist.
 
         Returns:
             str: The filepath where the PDF file is saved (or already exists).
 
         """
-        filename = url.split("/")[-1]
-        if not filename.endswith(".pdf"):
-            filename += ".pdf"
-        filepath = os.path.join(self.save_directory, filename)
-        if not os.path.exists(self.save_directory):
-            os.makedirs(self.save_directory)
+        filepath = self._get_filepath(url)
+        if existing_filenames is None:
+            os.makedirs(self.save_directory, exist_ok=True)
+            file_exists = os.path.exists(filepath)
+        else:
+            file_exists = os.path.basename(filepath) in existing_filenames
 
         # Check if file already exists
-        if os.path.exists(filepath):
+        if file_exists:
             print(f"Arquivo já existe, pulando download: {filepath}")
             return filepath
 
         # Download the file if it doesn't exist
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(filepath, "wb") as file:
-            file.write(response.content)
-        return filepath
+        return self.download_file_to(url, filepath)
 
     def get_pdf_urls(self):
         """
@@ -76,14 +159,19 @@ class PDFDownloader:
             list: A list of URLs of the PDF files.
 
         """
-        response = requests.get(self.base_url)
+        # Fetch the listing through the pooled session: the connection opened here
+        # is kept alive and reused by the first PDF downloads to the same server
+        response = self.session.get(self.base_url, timeout=(5, 30))
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        pdf_links = soup.find_all("a", string="PDF")
-        pdf_urls = [link.get("href").replace("view", "download") for link in pdf_links]
+        # Parse the raw bytes: lxml rejects str input with an XML encoding
+        # declaration, and detects the encoding itself from the bytes
+        doc = lxml.html.fromstring(response.content)
+        hrefs = doc.xpath('//a[normalize-space()="PDF"]/@href')
+        # Only the first "view" is the OJS action in the URL path
+        pdf_urls = [href.replace("view", "download", 1) for href in hrefs]
         return pdf_urls
 
-    def donwload_pdf_files_from_url(self, num_urls_to_process=-1):
+    def donwload_pdf_files_from_url(self, num_urls_to_process=-1, on_file_ready=None):
         """
         Downloads and saves all the PDF files from the base URL.
         Skips files that already exist.
@@ -91,40 +179,77 @@ class PDFDownloader:
         Args:
             num_urls_to_process (int, optional): The number of PDF files to download and save.
                                                 If set to -1, all the PDF files will be processed.
+            on_file_ready (callable, optional): Called with the filepath of each PDF as soon as
+                                                it is available on disk (already existing or
+                                                downloaded), so it can be processed while the
+                                                remaining downloads run.
 
         """
         pdf_urls = self.get_pdf_urls()
-        downloaded_count = 0
-        skipped_count = 0
+        if num_urls_to_process != -1:
+            pdf_urls = pdf_urls[:num_urls_to_process]
+        total_files = len(pdf_urls)
 
-        # Determine total number of files to process
-        total_files = (
-            num_urls_to_process if num_urls_to_process != -1 else len(pdf_urls)
-        )
+        # List the existing files with a single directory read instead of one
+        # stat() per URL, before dispatching any download
+        os.makedirs(self.save_directory, exist_ok=True)
+        with os.scandir(self.save_directory) as entries:
+            existing_filenames = {entry.name for entry in entries if entry.is_file()}
 
+        todo = []
+        skipped_count = 0
         for i, url in enumerate(pdf_urls):
-            if num_urls_to_process != -1 and i >= num_urls_to_process:
-                break
-
-            # Check if file already exists before attempting download
-            filename = url.split("/")[-1]
-            if not filename.endswith(".pdf"):
-                filename += ".pdf"
-            filepath = os.path.join(self.save_directory, filename)
-            file_exists = os.path.exists(filepath)
-
-            if file_exists:
+            filepath = self._get_filepath(url)
+            filename = os.path.basename(filepath)
+            if filename in existing_filenames:
                 print(f"[{i+1}/{total_files}] Arquivo já existe, pulando: {filename}")
                 skipped_count += 1
+                if on_file_ready:
+                    on_file_ready(filepath)
             else:
-                print(f"[{i+1}/{total_files}] Baixando PDF de {url}")
-                pdf_path = self.download_and_save_pdf(url)
-                print(f"Arquivo criado: {pdf_path}")
-                downloaded_count += 1
+                todo.append(url)
+
+        downloaded_count = 0
+        failed_count = 0
+        done_count = skipped_count
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Keep a bounded number of downloads in flight instead of queuing
+            # every URL at once
+            pending = {}
+            urls_iter = iter(todo)
+            while True:
+                for url in urls_iter:
+                    future = executor.submit(
+                        self.download_and_save_pdf, url, existing_filenames
+                    )
+                    pending[future] = url
+                    if len(pending) >= 2 * self.max_workers:
+                        break
+                if not pending:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    url = pending.pop(future)
+                    done_count += 1
+                    try:
+                        pdf_path = future.result()
+                        print(
+                            f"[{done_count}/{total_files}] Arquivo criado: {pdf_path}"
+                        )
+                        downloaded_count += 1
+                        if on_file_ready:
+                            on_file_ready(pdf_path)
+                    except requests.RequestException as e:
+                        print(f"[{done_count}/{total_files}] Erro ao baixar {url}: {e}")
+                        failed_count += 1
 
         print(
             f"\nResumo: {downloaded_count} arquivo(s) baixado(s), {skipped_count} arquivo(s) já existente(s)"
         )
+        if failed_count:
+            print(f"{failed_count} arquivo(s) não puderam ser baixado(s)")
 
 
 # Exemplo de uso
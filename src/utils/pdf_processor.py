@@ -1,23 +1,37 @@
 import os
 import json
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import fitz
 
+# Start method for pools created while other threads are running: forking a
+# multi-threaded process can copy locks held by those threads and deadlock
+_THREAD_SAFE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 
 class PDFProcessor:
     """
     A class for processing PDF files. Processing here means extracting text from PDF files in a directory.
+    Files are parsed in parallel on a process pool, since text extraction is CPU-bound.
     """
 
-    def __init__(self, directory):
+    def __init__(self, directory, max_workers=None):
         """
         Initialize the PDFProcessor class.
 
         Args:
             directory (str): The directory where the PDF files are located.
+            max_workers (int, optional): Number of worker processes used to parse PDFs.
+                Default is None, which uses the number of CPUs.
         """
         self.directory = directory
+        self.max_workers = max_workers
 
-    def extract_text_from_each_page(self, pdf_path):
+    @staticmethod
+    def extract_text_from_each_page(pdf_path):
         """
         Extract text from each page of a PDF file using PyMuPDF (fitz).
 
@@ -61,35 +75,128 @@ class PDFProcessor:
                 - 'numPages': The number of pages in the file.
                 - 'base_filename': The filename without the extension.
         """
+        pdf_paths = [
+            os.path.join(self.directory, filename)
+            for filename in os.listdir(self.directory)
+            if filename.endswith(".pdf")
+        ]
+
+        parse = functools.partial(
+            PDFProcessor._parse_one,
+            number_of_pages_to_process=number_of_pages_to_process,
+        )
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(parse, pdf_paths, chunksize=4))
+
+        return self._collect_results(results, save_files)
+
+    def process_pdfs_from_queue(
+        self, file_queue, save_files=False, number_of_pages_to_process=1
+    ):
+        """
+        Process the PDF files whose paths are put on a queue, as they arrive.
+
+        Each path is submitted to the process pool as soon as it is taken from the
+        queue, so parsing overlaps with whatever produces the files (e.g. downloads).
+        Processing ends when None is taken from the queue. Since the producer usually
+        runs on other threads, the workers are not forked from this process.
+
+        Args:
+            file_queue (queue.Queue): Queue of PDF file paths, terminated by None.
+            save_files (bool, optional): Indicates whether text files should be saved. Default is False.
+            number_of_pages_to_process (int, optional): The number of pages to process in each PDF. Default is 1.
+                If -1, processes all pages. Otherwise, limits to the specified number of pages.
+
+        Returns:
+            list: A list containing the data of all processed PDF files, in the order they were
+                 queued. See process_all_pdfs for the structure of each item.
+        """
+        futures = []
+        mp_context = multiprocessing.get_context(_THREAD_SAFE_START_METHOD)
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=mp_context
+        ) as executor:
+            while True:
+                pdf_path = file_queue.get()
+                if pdf_path is None:
+                    break
+                futures.append(
+                    executor.submit(
+                        PDFProcessor._parse_one, pdf_path, number_of_pages_to_process
+                    )
+                )
+            results = [future.result() for future in futures]
+
+        return self._collect_results(results, save_files)
+
+    def _collect_results(self, results, save_files):
+        """
+        Gather the data of the parsed PDF files, optionally saving it.
+
+        Args:
+            results (list): Values returned by _parse_one.
+            save_files (bool): Indicates whether text files should be saved.
+
+        Returns:
+            list: The data of the PDF files that could be parsed.
+        """
         allFilesData = []
-        for filename in os.listdir(self.directory):
-            if filename.endswith(".pdf"):
-                pdf_path = os.path.join(self.directory, filename)
-                text_pages, numPages = self.extract_text_from_each_page(pdf_path)
-
-                # Limit the number of pages to process if specified
-                original_num_pages = numPages
-                if number_of_pages_to_process != -1 and number_of_pages_to_process > 0:
-                    # Process only the first N pages
-                    text_pages = text_pages[:number_of_pages_to_process]
-                    # Update numPages to reflect the actual number of pages processed
-                    numPages = min(original_num_pages, number_of_pages_to_process)
-
-                # Separate the filename from its extension
-                base_filename = os.path.splitext(filename)[0]
-                fileData = {
-                    "text_pages": text_pages,
-                    "numPages": numPages,
-                    "base_filename": base_filename,
-                }
-                allFilesData.append(fileData)
-                if save_files:
-                    # Save the dictionary to a .json file
-                    os.makedirs("outputs/text", exist_ok=True)
-                    with open("outputs/text/" + base_filename + ".json", "w") as f:
-                        json.dump(fileData, f)
+        for fileData in results:
+            # Skip files that could not be parsed
+            if fileData is None:
+                continue
+            allFilesData.append(fileData)
+            if save_files:
+                self.save_file_data(fileData)
         return allFilesData
 
+    @staticmethod
+    def _parse_one(pdf_path, number_of_pages_to_process):
+        """
+        Extract the text of a single PDF file. Runs in a worker process.
+
+        Args:
+            pdf_path (str): The full path of the PDF file.
+            number_of_pages_to_process (int): The number of pages to process.
+                If -1, processes all pages.
+
+        Returns:
+            dict: The file data (see process_all_pdfs), or None if the file could not be parsed.
+        """
+        try:
+            text_pages, numPages = PDFProcessor.extract_text_from_each_page(pdf_path)
+        except Exception as e:
+            print(f"Erro ao processar PDF {pdf_path}: {e}")
+            return None
+
+        # Limit the number of pages to process if specified
+        original_num_pages = numPages
+        if number_of_pages_to_process != -1 and number_of_pages_to_process > 0:
+            # Process only the first N pages
+            text_pages = text_pages[:number_of_pages_to_process]
+            # Update numPages to reflect the actual number of pages processed
+            numPages = min(original_num_pages, number_of_pages_to_process)
+
+        # Separate the filename from its extension
+        base_filename = os.path.splitext(os.path.basename(pdf_path))[0]
+        return {
+            "text_pages": text_pages,
+            "numPages": numPages,
+            "base_filename": base_filename,
+        }
+
+    @staticmethod
+    def save_file_data(fileData):
+        """
+        Save the data of a processed PDF file to a .json file in outputs/text.
+
+        Args:
+            fileData (dict): The file data returned by _parse_one.
+        """
+        os.makedirs("outputs/text", exist_ok=True)
+        with open("outputs/text/" + fileData["base_filename"] + ".json", "w") as f:
+            json.dump(fileData, f)
+
 
 # Example usage
 if __name__ == "__main__":